@@ -0,0 +1,137 @@
+"""처리 결과 캐시 모듈"""
+
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from .metadata import TrackMetadata
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime INTEGER NOT NULL,
+    fp_duration INTEGER,
+    fp_hash TEXT,
+    recording_id TEXT,
+    acoustid_score REAL,
+    metadata_json TEXT,
+    ts REAL NOT NULL
+)
+"""
+
+
+@dataclass
+class CacheEntry:
+    """캐시된 파일 처리 결과"""
+
+    fp_duration: Optional[int] = None
+    fp_hash: Optional[str] = None
+    recording_id: Optional[str] = None
+    acoustid_score: Optional[float] = None
+    metadata: Optional[TrackMetadata] = None
+
+
+class ResultCache:
+    """
+    파일별 핑거프린트/AcoustID/MusicBrainz 결과를 SQLite에 저장합니다.
+
+    파일 경로, 크기, 수정 시각이 모두 같을 때만 캐시가 유효합니다.
+    """
+
+    def __init__(self, db_path: str, max_age_days: Optional[float] = 30):
+        self._max_age = max_age_days * 86400 if max_age_days else None
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def get(self, file_path: Path) -> Optional[CacheEntry]:
+        """파일의 캐시 항목을 반환합니다. 파일이 바뀌었거나 오래된 경우 None."""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size, mtime, fp_duration, fp_hash, recording_id, "
+                "acoustid_score, metadata_json, ts FROM results WHERE path = ?",
+                (str(file_path),),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        size, mtime, fp_duration, fp_hash, recording_id, score, metadata_json, ts = row
+        if size != stat.st_size or mtime != stat.st_mtime_ns:
+            return None
+        if self._max_age and time.time() - ts > self._max_age:
+            return None
+
+        metadata = None
+        if metadata_json:
+            try:
+                metadata = TrackMetadata(**json.loads(metadata_json))
+            except (TypeError, ValueError):
+                metadata = None
+
+        return CacheEntry(
+            fp_duration=fp_duration,
+            fp_hash=fp_hash,
+            recording_id=recording_id,
+            acoustid_score=score,
+            metadata=metadata,
+        )
+
+    def put(
+        self,
+        file_path: Path,
+        fp_duration: Optional[int] = None,
+        fp_hash: Optional[str] = None,
+        recording_id: Optional[str] = None,
+        acoustid_score: Optional[float] = None,
+        metadata: Optional[TrackMetadata] = None,
+    ) -> None:
+        """파일의 현재 크기/수정 시각 기준으로 결과를 저장합니다."""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return
+
+        metadata_json = (
+            json.dumps(metadata.to_dict(), ensure_ascii=False) if metadata else None
+        )
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    str(file_path),
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                    fp_duration,
+                    fp_hash,
+                    recording_id,
+                    acoustid_score,
+                    metadata_json,
+                    time.time(),
+                ),
+            )
+            self._conn.commit()
+
+    def remove(self, file_path: Path) -> None:
+        """파일의 캐시 항목을 삭제합니다."""
+        with self._lock:
+            self._conn.execute("DELETE FROM results WHERE path = ?", (str(file_path),))
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
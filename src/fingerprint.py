@@ -6,6 +6,12 @@ from typing import Optional
 
 import acoustid
 
+# AcoustID 조회 시 함께 받을 메타데이터
+ACOUSTID_META = "recordings releasegroups"
+
+# 한 번의 AcoustID 요청에 묶을 최대 핑거프린트 수
+DEFAULT_BATCH_SIZE = 10
+
 
 class FingerprintError(Exception):
     """핑거프린팅 관련 에러"""
@@ -24,6 +30,23 @@ def check_fpcalc_installed() -> bool:
         return False
 
 
+def get_fingerprint_backend() -> Optional[str]:
+    """
+    사용할 핑거프린트 생성 방식을 반환합니다.
+
+    libchromaprint와 audioread가 있으면 파일마다 fpcalc 프로세스를 띄우지 않고
+    현재 프로세스 안에서 디코딩/핑거프린팅합니다 (pyacoustid가 자동으로 우선 사용).
+
+    Returns:
+        "chromaprint", "fpcalc" 또는 None (둘 다 없을 때)
+    """
+    if acoustid.have_chromaprint and acoustid.have_audioread:
+        return "chromaprint"
+    if check_fpcalc_installed():
+        return "fpcalc"
+    return None
+
+
 def get_fingerprint(file_path: Path) -> tuple[int, str]:
     """
     오디오 파일의 핑거프린트를 생성합니다.
@@ -45,7 +68,10 @@ def get_fingerprint(file_path: Path) -> tuple[int, str]:
 
 
 def lookup_acoustid(
-    api_key: str, file_path: Path
+    api_key: str,
+    file_path: Path,
+    fingerprint: Optional[str] = None,
+    duration: Optional[int] = None,
 ) -> Optional[list[dict]]:
     """
     AcoustID API로 오디오 파일을 조회합니다.
@@ -53,31 +79,100 @@ def lookup_acoustid(
     Args:
         api_key: AcoustID API 키
         file_path: MP3 파일 경로
+        fingerprint: 미리 계산한 핑거프린트 (없으면 새로 생성)
+        duration: 미리 계산한 재생 시간 (fingerprint와 함께 지정)
 
     Returns:
         매칭된 결과 리스트 또는 None
     """
-    try:
-        results = acoustid.match(
-            api_key,
-            str(file_path),
-            meta="recordings releasegroups",
-            parse=False,
-        )
-
-        if results.get("status") != "ok":
+    if fingerprint is None or duration is None:
+        try:
+            duration, fingerprint = get_fingerprint(file_path)
+        except FingerprintError:
             return None
 
-        matches = results.get("results", [])
-        if not matches:
-            return None
+    try:
+        results = acoustid.lookup(api_key, fingerprint, duration, meta=ACOUSTID_META)
+    except acoustid.WebServiceError as e:
+        raise FingerprintError(f"AcoustID API 오류: {e}")
 
-        return matches
+    if results.get("status") != "ok":
+        return None
 
-    except acoustid.FingerprintGenerationError:
+    matches = results.get("results", [])
+    if not matches:
         return None
-    except acoustid.WebServiceError as e:
-        raise FingerprintError(f"AcoustID API 오류: {e}")
+
+    return matches
+
+
+def lookup_acoustid_batch(
+    api_key: str,
+    files: list[Path],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    fingerprints: Optional[dict[Path, tuple[int, str]]] = None,
+) -> dict[Path, Optional[list[dict]]]:
+    """
+    여러 오디오 파일을 묶어서 AcoustID API로 조회합니다.
+
+    핑거프린트는 로컬에서 생성하고, batch_size개씩 하나의 요청
+    (fingerprint.N / duration.N 파라미터)으로 전송합니다.
+
+    Args:
+        api_key: AcoustID API 키
+        files: MP3 파일 경로 리스트
+        batch_size: 한 번의 요청에 포함할 최대 파일 수
+        fingerprints: 미리 계산한 (duration, fingerprint) 딕셔너리
+            (지정하면 여기에 없는 파일은 핑거프린트 생성 실패로 처리)
+
+    Returns:
+        파일 경로별 매칭 결과 리스트 또는 None 딕셔너리
+
+    Raises:
+        FingerprintError: AcoustID API 요청 실패 시
+    """
+    results: dict[Path, Optional[list[dict]]] = {file_path: None for file_path in files}
+
+    pending = []
+    for file_path in files:
+        if fingerprints is not None:
+            if file_path not in fingerprints:
+                continue
+            duration, fingerprint = fingerprints[file_path]
+        else:
+            try:
+                duration, fingerprint = get_fingerprint(file_path)
+            except FingerprintError:
+                # 단건 조회와 동일하게 매칭 실패로 처리
+                continue
+        pending.append((file_path, duration, fingerprint))
+
+    for start in range(0, len(pending), batch_size):
+        batch = pending[start:start + batch_size]
+
+        params = {"format": "json", "client": api_key, "meta": ACOUSTID_META}
+        for index, (_, duration, fingerprint) in enumerate(batch):
+            params[f"duration.{index}"] = int(duration)
+            params[f"fingerprint.{index}"] = fingerprint
+
+        try:
+            # pyacoustid의 요청 함수를 그대로 사용 (압축 및 rate limiting 포함)
+            response = acoustid._api_request(acoustid._get_lookup_url(), params)
+        except acoustid.WebServiceError as e:
+            raise FingerprintError(f"AcoustID API 오류: {e}")
+
+        if response.get("status") != "ok":
+            continue
+
+        for entry in response.get("fingerprints", []):
+            try:
+                index = int(entry.get("index"))
+            except (TypeError, ValueError):
+                continue
+            if 0 <= index < len(batch):
+                results[batch[index][0]] = entry.get("results") or None
+
+    return results
 
 
 def get_best_match(matches: list[dict]) -> Optional[dict]:
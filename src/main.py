@@ -1,41 +1,41 @@
 #!/usr/bin/env python3
 """MP3 Auto Organizer - 스마트 MP3 메타데이터 및 파일 정리 도구"""
 
+from __future__ import annotations
+
 import argparse
+import atexit
+import contextlib
+import itertools
+import json
 import logging
+import logging.handlers
 import os
 import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import IO, TYPE_CHECKING, Iterator, Optional
 
-import yaml
-from dotenv import load_dotenv
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.table import Table
-from rich.panel import Panel
-from rich import print as rprint
-
-from .scanner import scan_mp3_files, count_mp3_files, get_file_info
-from .fingerprint import (
-    check_fpcalc_installed,
-    lookup_acoustid,
-    get_best_match,
-    extract_recording_id,
-    FingerprintError,
-)
-from .metadata import (
-    TrackMetadata,
-    fetch_metadata_by_recording_id,
-    find_track_number,
-)
-from .tagger import update_tags, read_current_tags
-from .organizer import organize_file, move_to_unmatched
+
+# 파이프라인 모듈(acoustid, musicbrainzngs, mutagen 등)과 yaml, rich 위젯은 사용하는
+# 함수 안에서 import합니다. --help나 설정 오류로 바로 끝나는 경우 로딩 비용을 피합니다.
+if TYPE_CHECKING:
+    from .cache import ResultCache
+    from .organizer import TemplateFormatter
 
 console = Console()
 
+# 동시에 처리할 파일 수 기본값 (네트워크 대기 시간이 대부분이라 CPU 수와 무관)
+DEFAULT_WORKERS = 4
+
 
 def load_config(config_path: str = "config.yaml") -> dict:
     """설정 파일과 환경 변수를 로드합니다."""
+    import yaml
+    from dotenv import load_dotenv
+
     # .env 파일 로드
     load_dotenv()
 
@@ -58,6 +58,47 @@ def load_config(config_path: str = "config.yaml") -> dict:
     return config
 
 
+class _BatchingMemoryHandler(logging.handlers.MemoryHandler):
+    """
+    모아 둔 로그 기록을 한 번의 write로 대상 파일에 씁니다.
+
+    기본 MemoryHandler.flush는 기록마다 대상 핸들러를 호출해 매번 write/flush하므로,
+    버퍼 전체를 먼저 문자열로 만든 뒤 한 번에 기록합니다.
+    """
+
+    def flush(self):
+        self.acquire()
+        try:
+            # 대상이 없으면 기본 MemoryHandler처럼 기록을 버퍼에 남겨 둠
+            if self.target is None or not self.buffer:
+                return
+            try:
+                # 기록별로 포맷 오류를 처리하여 잘못된 기록 하나 때문에 나머지를 잃지 않게 함
+                parts = []
+                for record in self.buffer:
+                    try:
+                        parts.append(self.target.format(record) + self.target.terminator)
+                    except Exception:
+                        self.handleError(record)
+                if parts:
+                    self._write(parts)
+            finally:
+                self.buffer.clear()
+        finally:
+            self.release()
+
+    def _write(self, parts: list[str]) -> None:
+        self.target.acquire()
+        try:
+            self.target.stream.write("".join(parts))
+            self.target.stream.flush()
+        except Exception:
+            # 디스크 가득 참 등 쓰기 오류는 logging 규칙대로 알리기만 하고 넘어감
+            self.handleError(self.buffer[-1])
+        finally:
+            self.target.release()
+
+
 def setup_logging(log_file: str) -> logging.Logger:
     """로깅을 설정합니다."""
     logger = logging.getLogger("mp3-organizer")
@@ -68,24 +109,72 @@ def setup_logging(log_file: str) -> logging.Logger:
     file_handler.setFormatter(
         logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
     )
-    logger.addHandler(file_handler)
+
+    # 기록을 모아서 한 번에 쓰기 (ERROR는 즉시 기록, 종료 시 남은 기록 flush)
+    memory_handler = _BatchingMemoryHandler(
+        capacity=1024, flushLevel=logging.ERROR, target=file_handler
+    )
+    atexit.register(memory_handler.flush)
+    logger.addHandler(memory_handler)
 
     return logger
 
 
+def _generate_fingerprint(
+    file_path: Path, cache: Optional[ResultCache] = None
+) -> Optional[tuple[int, str]]:
+    """
+    핑거프린트를 생성하고 캐시에 저장합니다.
+
+    Returns:
+        (duration, fingerprint) 튜플 또는 None (생성 실패 시)
+    """
+    from .fingerprint import FingerprintError, get_fingerprint
+
+    try:
+        duration, fingerprint = get_fingerprint(file_path)
+    except FingerprintError:
+        return None
+
+    if cache:
+        cache.put(file_path, fp_duration=duration, fp_hash=fingerprint)
+
+    return duration, fingerprint
+
+
 def process_file(
     file_path: Path,
     config: dict,
     logger: logging.Logger,
     source_base_path: Path,
     dry_run: bool = True,
+    acoustid_results: Optional[dict[Path, Optional[list[dict]]]] = None,
+    cache: Optional[ResultCache] = None,
+    folder_template: Optional[TemplateFormatter] = None,
+    filename_template: Optional[TemplateFormatter] = None,
 ) -> dict:
     """
     단일 MP3 파일을 처리합니다.
 
+    Args:
+        acoustid_results: 일괄 조회된 AcoustID 결과 (없으면 파일별로 조회)
+        cache: 처리 결과 캐시 (없으면 항상 네트워크 조회)
+        folder_template: 미리 compile_template한 폴더 템플릿 (없으면 설정에서 생성)
+        filename_template: 미리 compile_template한 파일명 템플릿 (없으면 설정에서 생성)
+
     Returns:
         처리 결과 딕셔너리
     """
+    from .fingerprint import (
+        FingerprintError,
+        extract_recording_id,
+        get_best_match,
+        lookup_acoustid,
+    )
+    from .metadata import fetch_metadata_by_recording_id, find_track_number
+    from .organizer import compile_template, move_to_unmatched, organize_file
+    from .tagger import load_current_tags, tags_up_to_date, update_tags
+
     result = {
         "file": str(file_path),
         "status": "pending",
@@ -103,68 +192,106 @@ def process_file(
     output_path = Path(config.get("output_path") or config.get("source_path"))
     unmatched_folder = config.get("options", {}).get("unmatched_folder", "_unmatched")
 
-    # 1. AcoustID로 곡 식별
-    try:
-        matches = lookup_acoustid(api_key, file_path)
-    except FingerprintError as e:
-        result["status"] = "error"
-        result["error"] = str(e)
-        logger.error(f"핑거프린팅 실패: {file_path} - {e}")
-        return result
-
-    if not matches:
-        result["status"] = "unmatched"
-        result["file_changes"] = move_to_unmatched(
-            file_path, source_base_path, output_path, unmatched_folder, dry_run
-        )
-        logger.warning(f"매칭 실패: {file_path}")
-        return result
-
-    # 2. 가장 좋은 매칭 선택
-    best_match = get_best_match(matches)
-    if not best_match:
-        result["status"] = "unmatched"
-        result["error"] = "신뢰도 높은 매칭을 찾지 못했습니다"
-        result["file_changes"] = move_to_unmatched(
-            file_path, source_base_path, output_path, unmatched_folder, dry_run
-        )
-        logger.warning(f"낮은 신뢰도 매칭: {file_path}")
-        return result
-
-    recording_id = extract_recording_id(best_match)
-    if not recording_id:
-        result["status"] = "unmatched"
-        result["error"] = "Recording ID를 찾지 못했습니다"
-        result["file_changes"] = move_to_unmatched(
-            file_path, source_base_path, output_path, unmatched_folder, dry_run
-        )
-        return result
+    # 이전 실행 결과 캐시 확인 (파일이 바뀌지 않았으면 네트워크 조회 생략)
+    cached = cache.get(file_path) if cache else None
+    metadata = cached.metadata if cached else None
+    fingerprint = (cached.fp_duration, cached.fp_hash) if cached and cached.fp_hash else None
+    if metadata:
+        result["acoustid_score"] = cached.acoustid_score
+        result["cached"] = True
+        recording_id = cached.recording_id
+
+    if metadata is None:
+        # 1. AcoustID로 곡 식별
+        if acoustid_results is not None and file_path in acoustid_results:
+            matches = acoustid_results[file_path]
+        else:
+            if fingerprint is None:
+                fingerprint = _generate_fingerprint(file_path, cache)
+
+            if fingerprint is None:
+                # 핑거프린트 생성 실패는 매칭 실패로 처리
+                matches = None
+            else:
+                try:
+                    matches = lookup_acoustid(
+                        api_key, file_path,
+                        fingerprint=fingerprint[1], duration=fingerprint[0],
+                    )
+                except FingerprintError as e:
+                    result["status"] = "error"
+                    result["error"] = str(e)
+                    logger.error(f"핑거프린팅 실패: {file_path} - {e}")
+                    return result
+
+        if not matches:
+            result["status"] = "unmatched"
+            result["file_changes"] = move_to_unmatched(
+                file_path, source_base_path, output_path, unmatched_folder, dry_run
+            )
+            logger.warning(f"매칭 실패: {file_path}")
+            return result
+
+        # 2. 가장 좋은 매칭 선택
+        best_match = get_best_match(matches)
+        if not best_match:
+            result["status"] = "unmatched"
+            result["error"] = "신뢰도 높은 매칭을 찾지 못했습니다"
+            result["file_changes"] = move_to_unmatched(
+                file_path, source_base_path, output_path, unmatched_folder, dry_run
+            )
+            logger.warning(f"낮은 신뢰도 매칭: {file_path}")
+            return result
+
+        recording_id = extract_recording_id(best_match)
+        if not recording_id:
+            result["status"] = "unmatched"
+            result["error"] = "Recording ID를 찾지 못했습니다"
+            result["file_changes"] = move_to_unmatched(
+                file_path, source_base_path, output_path, unmatched_folder, dry_run
+            )
+            return result
 
-    result["acoustid_score"] = best_match.get("score", 0)
+        result["acoustid_score"] = best_match.get("score", 0)
 
-    # 3. MusicBrainz에서 메타데이터 가져오기
-    metadata = fetch_metadata_by_recording_id(recording_id)
-    if not metadata:
-        result["status"] = "error"
-        result["error"] = "MusicBrainz에서 메타데이터를 가져오지 못했습니다"
-        return result
+        # 3. MusicBrainz에서 메타데이터 가져오기
+        metadata = fetch_metadata_by_recording_id(recording_id)
+        if not metadata:
+            result["status"] = "error"
+            result["error"] = "MusicBrainz에서 메타데이터를 가져오지 못했습니다"
+            return result
 
-    # 4. 트랙 번호 찾기 (release에서)
-    if metadata.musicbrainz_release_id and not metadata.track_number:
-        track_info = find_track_number(
-            recording_id, metadata.musicbrainz_release_id
-        )
-        if track_info:
-            metadata.track_number = track_info[0]
-            metadata.total_tracks = track_info[1]
-            metadata.disc_number = track_info[2]
+        # 4. 트랙 번호 찾기 (release에서)
+        if metadata.musicbrainz_release_id and not metadata.track_number:
+            track_info = find_track_number(
+                recording_id, metadata.musicbrainz_release_id
+            )
+            if track_info:
+                metadata.track_number = track_info[0]
+                metadata.total_tracks = track_info[1]
+                metadata.disc_number = track_info[2]
+
+        if cache:
+            cache.put(
+                file_path,
+                fp_duration=fingerprint[0] if fingerprint else None,
+                fp_hash=fingerprint[1] if fingerprint else None,
+                recording_id=recording_id,
+                acoustid_score=result["acoustid_score"],
+                metadata=metadata,
+            )
 
     result["metadata"] = metadata.to_dict()
 
-    # 5. ID3 태그 업데이트
+    # 5. ID3 태그 업데이트 (파일은 한 번만 열고, 이미 같은 태그면 다시 쓰지 않음)
     try:
-        tag_changes = update_tags(file_path, metadata, dry_run=dry_run)
-        result["tag_changes"] = tag_changes
+        current_tags = load_current_tags(file_path)
+        if tags_up_to_date(current_tags, metadata):
+            result["tags_skipped"] = True
+        else:
+            result["tag_changes"] = update_tags(
+                file_path, metadata, dry_run=dry_run, current_tags=current_tags
+            )
     except Exception as e:
         result["status"] = "error"
         result["error"] = f"태그 업데이트 실패: {e}"
@@ -186,8 +313,12 @@ def process_file(
             file_path=file_path,
             metadata=metadata,
             output_path=output_path,
-            folder_template=config.get("folder_template", "{artist}/{album}"),
-            filename_template=config.get("filename_template", "{track:02d} - {title}"),
+            folder_template=folder_template or compile_template(
+                config.get("folder_template", "{artist}/{album}")
+            ),
+            filename_template=filename_template or compile_template(
+                config.get("filename_template", "{track:02d} - {title}")
+            ),
             dry_run=dry_run,
             backup_path=backup_path,
         )
@@ -198,6 +329,20 @@ def process_file(
         logger.error(f"파일 정리 실패: {file_path} - {e}")
         return result
 
+    # 태그/위치가 바뀐 파일도 다음 실행에서 캐시를 사용할 수 있도록 갱신
+    if cache and not dry_run:
+        final_path = Path(file_changes.get("destination", file_path))
+        if file_changes.get("moved"):
+            cache.remove(file_path)
+        cache.put(
+            final_path,
+            fp_duration=fingerprint[0] if fingerprint else None,
+            fp_hash=fingerprint[1] if fingerprint else None,
+            recording_id=recording_id,
+            acoustid_score=result.get("acoustid_score"),
+            metadata=metadata,
+        )
+
     result["status"] = "success"
     logger.info(
         f"처리 완료: {file_path} -> {metadata.artist} - {metadata.title}"
@@ -206,11 +351,129 @@ def process_file(
     return result
 
 
-def print_summary(results: list[dict], dry_run: bool):
+def process_batch(
+    files: list[Path],
+    config: dict,
+    logger: logging.Logger,
+    source_base_path: Path,
+    dry_run: bool = True,
+    cache: Optional[ResultCache] = None,
+    folder_template: Optional[TemplateFormatter] = None,
+    filename_template: Optional[TemplateFormatter] = None,
+) -> list[dict]:
+    """
+    여러 MP3 파일의 AcoustID 조회를 한 번에 수행한 뒤 각각 처리합니다.
+
+    일괄 조회가 실패하면 파일별 조회로 대체합니다.
+    캐시에 메타데이터가 있는 파일은 일괄 조회에서 제외합니다.
+
+    Returns:
+        처리 결과 딕셔너리 리스트
+    """
+    from .fingerprint import FingerprintError, lookup_acoustid_batch
+
+    api_key = config.get("acoustid_api_key", "")
+    acoustid_results = None
+
+    candidates = []
+    for file_path in files:
+        cached = cache.get(file_path) if cache else None
+        if not (cached and cached.metadata):
+            candidates.append((file_path, cached))
+
+    if len(candidates) > 1:
+        # 캐시된 핑거프린트는 재사용하고, 없으면 한 번만 생성해 캐시에 저장
+        fingerprints = {}
+        for file_path, cached in candidates:
+            if cached and cached.fp_hash:
+                fingerprints[file_path] = (cached.fp_duration, cached.fp_hash)
+            else:
+                fingerprint = _generate_fingerprint(file_path, cache)
+                if fingerprint:
+                    fingerprints[file_path] = fingerprint
+
+        pending = [file_path for file_path, _ in candidates]
+        try:
+            acoustid_results = lookup_acoustid_batch(
+                api_key, pending, batch_size=len(pending), fingerprints=fingerprints
+            )
+        except FingerprintError as e:
+            logger.warning(f"AcoustID 일괄 조회 실패, 파일별로 조회합니다: {e}")
+
+    return [
+        process_file(
+            file_path, config, logger,
+            source_base_path=source_base_path,
+            dry_run=dry_run,
+            acoustid_results=acoustid_results,
+            cache=cache,
+            folder_template=folder_template,
+            filename_template=filename_template,
+        )
+        for file_path in files
+    ]
+
+
+@dataclass
+class ProcessResults:
+    """
+    파일별 처리 결과 모음.
+
+    파일마다 결과 딕셔너리를 보관하지 않고 출력에 필요한 값만 필드별 리스트로
+    저장합니다. results_log가 있으면 전체 결과를 JSON Lines로 바로 기록합니다.
+    """
+
+    files: list[str] = field(default_factory=list)
+    status: list[str] = field(default_factory=list)
+    errors: list[Optional[str]] = field(default_factory=list)
+    metadata: list[Optional[dict]] = field(default_factory=list)
+    destinations: list[Optional[str]] = field(default_factory=list)
+    results_log: Optional[IO[str]] = None
+
+    def append(self, result: dict) -> None:
+        file_changes = result.get("file_changes") or {}
+        self.files.append(result["file"])
+        self.status.append(result["status"])
+        self.errors.append(result.get("error"))
+        self.metadata.append(result.get("metadata"))
+        self.destinations.append(
+            file_changes.get("destination") if file_changes.get("moved") else None
+        )
+
+        if self.results_log:
+            self.results_log.write(json.dumps(result, ensure_ascii=False, default=str) + "\n")
+
+    def extend(self, results: list[dict]) -> None:
+        for result in results:
+            self.append(result)
+
+    def count(self, status: str) -> int:
+        return self.status.count(status)
+
+    def __len__(self) -> int:
+        return len(self.status)
+
+    def __iter__(self) -> Iterator[dict]:
+        """print_file_result에서 사용하는 형태의 딕셔너리를 차례로 만듭니다."""
+        for file_path, status, error, metadata, destination in zip(
+            self.files, self.status, self.errors, self.metadata, self.destinations
+        ):
+            result = {"file": file_path, "status": status, "metadata": metadata}
+            if error:
+                result["error"] = error
+            if destination:
+                result["file_changes"] = {"moved": True, "destination": destination}
+            yield result
+
+
+def print_summary(results: ProcessResults, dry_run: bool):
     """처리 결과 요약을 출력합니다."""
-    success = sum(1 for r in results if r["status"] == "success")
-    unmatched = sum(1 for r in results if r["status"] == "unmatched")
-    errors = sum(1 for r in results if r["status"] == "error")
+    from rich.panel import Panel
+    from rich.table import Table
+
+    success = results.count("success")
+    unmatched = results.count("unmatched")
+    errors = results.count("error")
 
     table = Table(title="처리 결과 요약")
     table.add_column("상태", style="bold")
@@ -296,6 +559,11 @@ def main():
         type=int,
         help="처리할 최대 파일 수 (테스트용)",
     )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        help=f"동시에 처리할 파일 수 (기본: {DEFAULT_WORKERS}, 설정 파일보다 우선)",
+    )
 
     args = parser.parse_args()
 
@@ -311,8 +579,12 @@ def main():
     elif args.no_dry_run:
         config["options"]["dry_run"] = False
 
+    if args.workers:
+        config["options"]["workers"] = args.workers
+
     dry_run = config.get("options", {}).get("dry_run", True)
     source_path = config.get("source_path", "")
+    workers = max(1, config.get("options", {}).get("workers", DEFAULT_WORKERS))
 
     # 유효성 검사
     if not source_path:
@@ -325,9 +597,30 @@ def main():
         console.print(".env 파일에 ACOUSTID_API_KEY를 설정해주세요.")
         sys.exit(1)
 
-    # fpcalc 확인
-    if not check_fpcalc_installed():
-        console.print("[red]fpcalc(Chromaprint)가 설치되어 있지 않습니다.[/red]")
+    # 설정 오류로 끝나는 경우가 아니면 여기서부터 파이프라인 모듈과 rich 위젯을 로드
+    from rich.panel import Panel
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+
+    from .cache import ResultCache
+    from .fingerprint import DEFAULT_BATCH_SIZE, get_fingerprint_backend
+    from .organizer import compile_template
+    from .scanner import iter_scan_queue, scan_mp3_files_async, scan_mp3_files_parallel
+
+    batch_size = max(
+        1, config.get("options", {}).get("acoustid_batch_size", DEFAULT_BATCH_SIZE)
+    )
+    scan_workers = config.get("options", {}).get("scan_workers", 1)
+
+    # 경로 템플릿은 한 번만 준비해서 모든 워커가 같이 사용
+    folder_template = compile_template(config.get("folder_template", "{artist}/{album}"))
+    filename_template = compile_template(
+        config.get("filename_template", "{track:02d} - {title}")
+    )
+
+    # 핑거프린트 생성 방식 확인 (libchromaprint 우선, 없으면 fpcalc)
+    fingerprint_backend = get_fingerprint_backend()
+    if not fingerprint_backend:
+        console.print("[red]Chromaprint(libchromaprint 또는 fpcalc)가 설치되어 있지 않습니다.[/red]")
         console.print("설치: brew install chromaprint")
         sys.exit(1)
 
@@ -341,6 +634,7 @@ def main():
         Panel(
             "[bold blue]MP3 Auto Organizer[/bold blue]\n"
             f"소스: {source_path}\n"
+            f"핑거프린트: {fingerprint_backend}\n"
             f"모드: {'[yellow]Dry-run (미리보기)[/yellow]' if dry_run else '[green]실제 적용[/green]'}",
             title="시작",
         )
@@ -350,48 +644,109 @@ def main():
     console.print()
     console.print("[bold]MP3 파일 스캔 중...[/bold]")
 
+    # 첫 파일만 미리 확인하고, 나머지는 스캔하면서 바로 처리합니다 (트리는 한 번만 순회)
     try:
-        file_count = count_mp3_files(source_path)
+        if scan_workers > 1:
+            scanned = scan_mp3_files_parallel(source_path, workers=scan_workers)
+        else:
+            # 스캔은 별도 스레드에서 앞서 진행하여 파일 처리와 겹치게 함
+            scanned = iter_scan_queue(scan_mp3_files_async(source_path))
+        first_file = next(scanned, None)
     except (FileNotFoundError, NotADirectoryError) as e:
         console.print(f"[red]{e}[/red]")
         sys.exit(1)
 
-    if file_count == 0:
+    if first_file is None:
         console.print("[yellow]MP3 파일을 찾지 못했습니다.[/yellow]")
         sys.exit(0)
 
-    console.print(f"총 [cyan]{file_count}[/cyan]개 파일 발견")
-
     if args.limit:
         console.print(f"[dim]--limit 옵션: 최대 {args.limit}개 파일만 처리[/dim]")
 
-    # 파일 처리
-    results = []
-    console.print()
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task("처리 중...", total=min(file_count, args.limit or file_count))
-
-        for idx, file_path in enumerate(scan_mp3_files(source_path)):
-            if args.limit and idx >= args.limit:
-                break
-
-            progress.update(task, description=f"처리 중: {file_path.name[:30]}...")
-
-            result = process_file(
-                file_path, config, logger,
-                source_base_path=Path(source_path),
-                dry_run=dry_run
+    # 파일 처리 (중간에 예외나 Ctrl+C로 끝나도 결과 파일과 캐시는 닫음)
+    with contextlib.ExitStack() as stack:
+        cache_file = config.get("options", {}).get("cache_file")
+        cache = None
+        if cache_file:
+            cache = ResultCache(
+                cache_file,
+                max_age_days=config.get("options", {}).get("cache_max_age_days", 30),
             )
-            results.append(result)
+            stack.callback(cache.close)
+
+        results_file = config.get("options", {}).get("results_file")
+        results_log = (
+            stack.enter_context(open(results_file, "w", encoding="utf-8"))
+            if results_file
+            else None
+        )
+        results = ProcessResults(results_log=results_log)
+        console.print()
 
-            progress.advance(task)
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=console,
+        ) as progress:
+            # 전체 개수는 스캔이 끝나야 알 수 있으므로 그때까지는 진행률 미정
+            task = progress.add_task("스캔 중...", total=None)
+
+            # 스캔 결과를 batch_size개씩 묶어 워커에 제출하고, 끝나는 순서대로 결과를 모읍니다.
+            # 대기 중인 배치는 워커 수의 2배까지만 두어, 중단(Ctrl+C) 시 남은 작업을
+            # 바로 취소할 수 있게 합니다.
+            # MusicBrainz 요청은 metadata 모듈의 rate limit이 스레드 간에 공유됩니다.
+            files = itertools.islice(
+                itertools.chain([first_file], scanned), args.limit or None
+            )
+            batches = iter(lambda: list(itertools.islice(files, batch_size)), [])
+            max_in_flight = workers * 2
+            file_count = 0
+            scanning = True
+
+            executor = ThreadPoolExecutor(max_workers=workers)
+            try:
+                futures = {}
+                while scanning or futures:
+                    while scanning and len(futures) < max_in_flight:
+                        batch = next(batches, None)
+                        if batch is None:
+                            scanning = False
+                            progress.update(task, total=file_count, description="처리 중...")
+                            console.print(f"총 [cyan]{file_count}[/cyan]개 파일 발견")
+                            break
+                        future = executor.submit(
+                            process_batch,
+                            batch, config, logger,
+                            source_base_path=Path(source_path),
+                            dry_run=dry_run,
+                            cache=cache,
+                            folder_template=folder_template,
+                            filename_template=filename_template,
+                        )
+                        futures[future] = batch
+                        file_count += len(batch)
+                        progress.update(task, description=f"스캔 중: {file_count}개 발견")
+
+                    if not futures:
+                        break
+
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        batch = futures.pop(future)
+                        results.extend(future.result())
+                        if not scanning:
+                            progress.update(
+                                task, description=f"처리 중: {batch[-1].name[:30]}..."
+                            )
+                        progress.advance(task, len(batch))
+            except BaseException:
+                # 중단되면 아직 시작하지 않은 배치는 취소 (실행 중인 배치만 마저 끝남)
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            else:
+                executor.shutdown()
 
     # 결과 출력
     console.print()
@@ -404,13 +759,13 @@ def main():
     print_summary(results, dry_run)
 
     # 미인식 파일 처리 안내
-    unmatched = [r for r in results if r["status"] == "unmatched"]
+    unmatched = results.count("unmatched")
     if unmatched and not dry_run:
         unmatched_folder = config.get("options", {}).get("unmatched_folder", "_unmatched")
         output_path = Path(config.get("output_path") or config.get("source_path"))
         console.print()
         console.print(
-            f"[yellow]인식되지 않은 {len(unmatched)}개 파일은 "
+            f"[yellow]인식되지 않은 {unmatched}개 파일은 "
             f"'{output_path / unmatched_folder}' 폴더에서 확인할 수 있습니다.[/yellow]"
         )
 
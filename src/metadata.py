@@ -1,10 +1,16 @@
 """MusicBrainz 메타데이터 조회 모듈"""
 
+import functools
+import threading
 import time
+import urllib.error
+import urllib.request
 from dataclasses import dataclass
 from typing import Optional
 
 import musicbrainzngs
+import musicbrainzngs.musicbrainz
+import requests
 
 # MusicBrainz API 설정
 musicbrainzngs.set_useragent(
@@ -13,18 +19,100 @@ musicbrainzngs.set_useragent(
     "https://github.com/example/mp3-auto-organizer",
 )
 
+# musicbrainzngs 내장 rate limiter는 응답을 받을 때까지 lock을 잡고 있어 요청이
+# 하나씩만 진행됩니다. set_rate_limit(False)로 꺼도 _mb_request를 감싼 데코레이터가
+# lock 안에서 호출하므로, 데코레이터를 벗긴 원래 함수로 교체하고 아래 _rate_limit()로
+# 요청 시작 간격만 제한합니다. (요청은 초당 1회 간격으로 시작되고, 응답 대기는 겹칠 수 있음)
+musicbrainzngs.set_rate_limit(False)
+musicbrainzngs.musicbrainz._mb_request = getattr(
+    musicbrainzngs.musicbrainz._mb_request, "fun", musicbrainzngs.musicbrainz._mb_request
+)
+
+# musicbrainzngs는 요청마다 새 연결(TLS 핸드셰이크 포함)을 열기 때문에,
+# 스레드별 requests.Session으로 keep-alive 연결을 재사용하도록 교체합니다.
+_session_local = threading.local()
+_urllib_safe_read = musicbrainzngs.musicbrainz._safe_read
+
+
+def _get_session() -> requests.Session:
+    """현재 스레드의 MusicBrainz HTTP 세션을 반환합니다."""
+    session = getattr(_session_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _session_local.session = session
+    return session
+
+
+def _keepalive_safe_read(opener, req, body=None, max_retries=8, retry_delay_delta=2.0):
+    """
+    musicbrainzngs._safe_read 대체 함수.
+
+    재시도 및 에러 변환 규칙은 원래 함수와 같고, HTTP 연결만 세션으로 재사용합니다.
+    인증이 필요한 요청은 원래 함수로 처리합니다.
+    """
+    if any(isinstance(h, urllib.request.HTTPDigestAuthHandler) for h in opener.handlers):
+        return _urllib_safe_read(opener, req, body, max_retries, retry_delay_delta)
+
+    url = req.get_full_url()
+    last_exc = None
+    for retry_num in range(max_retries):
+        if retry_num:
+            time.sleep(retry_num * retry_delay_delta)
+
+        try:
+            response = _get_session().request(
+                req.get_method(),
+                url,
+                headers=dict(req.header_items()),
+                data=body or req.data,
+            )
+        except (requests.ConnectionError, requests.Timeout) as e:
+            # 끊어진 keep-alive 연결 등 일시적인 오류는 재시도
+            last_exc = e
+            continue
+        except requests.RequestException as e:
+            raise musicbrainzngs.NetworkError(cause=e)
+
+        if response.ok:
+            return response.content
+
+        error = urllib.error.HTTPError(
+            url, response.status_code, response.reason, response.headers, None
+        )
+        if response.status_code in (400, 404, 411):
+            raise musicbrainzngs.ResponseError(cause=error)
+        if response.status_code == 401:
+            raise musicbrainzngs.AuthenticationError(cause=error)
+        # 5xx (rate limiting, 서버 과부하) 및 기타 오류는 재시도
+        last_exc = error
+
+    raise musicbrainzngs.NetworkError("retried %i times" % max_retries, last_exc)
+
+
+musicbrainzngs.musicbrainz._safe_read = _keepalive_safe_read
+
 # Rate limiting을 위한 마지막 요청 시간
 _last_request_time = 0.0
 _MIN_REQUEST_INTERVAL = 1.0  # MusicBrainz는 초당 1회 제한
+_rate_limit_lock = threading.Lock()  # 워커 스레드 간 요청 간격 공유
+
+# 같은 앨범의 트랙들이 동시에 조회해도 릴리스 요청은 한 번만 보내도록 release_id별로 보호
+# (다른 릴리스 조회는 서로 기다리지 않음)
+_release_locks: dict[str, threading.Lock] = {}
+_release_locks_guard = threading.Lock()
 
 
 def _rate_limit():
-    """MusicBrainz API rate limiting 준수"""
+    """MusicBrainz API rate limiting 준수 (스레드 안전)"""
     global _last_request_time
-    elapsed = time.time() - _last_request_time
-    if elapsed < _MIN_REQUEST_INTERVAL:
-        time.sleep(_MIN_REQUEST_INTERVAL - elapsed)
-    _last_request_time = time.time()
+    with _rate_limit_lock:
+        elapsed = time.time() - _last_request_time
+        if elapsed < _MIN_REQUEST_INTERVAL:
+            time.sleep(_MIN_REQUEST_INTERVAL - elapsed)
+        _last_request_time = time.time()
 
 
 @dataclass
@@ -136,6 +224,12 @@ def _extract_artist_name(artist_credit: list) -> str:
     return "".join(names).strip() if names else "Unknown Artist"
 
 
+# 릴리스 선택 점수: 공식 릴리스 > 앨범 > EP > 싱글, 컴필레이션이 아닌 것 우선
+_STATUS_SCORES = {"official": 100}
+_PRIMARY_TYPE_SCORES = {"album": 50, "ep": 40, "single": 30}
+_NON_COMPILATION_SCORE = 20
+
+
 def _select_best_release(releases: list) -> dict:
     """
     가장 적합한 릴리스를 선택합니다.
@@ -144,33 +238,20 @@ def _select_best_release(releases: list) -> dict:
     if not releases:
         return {"album": "Unknown Album"}
 
-    # 점수 기반 정렬
-    def score_release(release):
-        score = 0
-        status = release.get("status", "").lower()
+    # 점수 기반 선택 (동점이면 먼저 나온 릴리스)
+    best_release = releases[0]
+    best_score = -1
+    for release in releases:
         release_group = release.get("release-group", {})
-        primary_type = release_group.get("primary-type", "").lower()
-
-        # 공식 릴리스 우선
-        if status == "official":
-            score += 100
-
-        # 앨범 타입 우선순위
-        if primary_type == "album":
-            score += 50
-        elif primary_type == "ep":
-            score += 40
-        elif primary_type == "single":
-            score += 30
-
-        # 컴필레이션이 아닌 것 우선
-        secondary_types = release_group.get("secondary-type-list", [])
-        if "Compilation" not in secondary_types:
-            score += 20
-
-        return score
-
-    best_release = max(releases, key=score_release)
+        score = (
+            _STATUS_SCORES.get(release.get("status", "").lower(), 0)
+            + _PRIMARY_TYPE_SCORES.get(release_group.get("primary-type", "").lower(), 0)
+        )
+        if "Compilation" not in release_group.get("secondary-type-list", []):
+            score += _NON_COMPILATION_SCORE
+        if score > best_score:
+            best_score = score
+            best_release = release
 
     # 릴리스 정보 추출
     result = {
@@ -205,16 +286,36 @@ def _select_best_release(releases: list) -> dict:
 
 
 def fetch_release_tracks(release_id: str) -> Optional[list[dict]]:
-    """릴리스의 전체 트랙 리스트를 가져옵니다."""
+    """
+    릴리스의 전체 트랙 리스트를 가져옵니다.
+
+    같은 앨범의 트랙마다 같은 릴리스를 조회하므로 결과를 release_id별로 캐시합니다.
+    """
+    with _release_lock(release_id):
+        try:
+            return list(_fetch_release_tracks_cached(release_id))
+        except musicbrainzngs.WebServiceError:
+            return None
+
+
+def _release_lock(release_id: str) -> threading.Lock:
+    """release_id 전용 lock을 반환합니다 (없으면 생성)."""
+    with _release_locks_guard:
+        lock = _release_locks.get(release_id)
+        if lock is None:
+            lock = _release_locks[release_id] = threading.Lock()
+        return lock
+
+
+@functools.lru_cache(maxsize=256)
+def _fetch_release_tracks_cached(release_id: str) -> tuple[dict, ...]:
+    """릴리스 트랙 리스트 조회 (실패 시 예외를 던지므로 실패 결과는 캐시되지 않음)"""
     _rate_limit()
 
-    try:
-        result = musicbrainzngs.get_release_by_id(
-            release_id,
-            includes=["recordings", "artists"],
-        )
-    except musicbrainzngs.WebServiceError:
-        return None
+    result = musicbrainzngs.get_release_by_id(
+        release_id,
+        includes=["recordings", "artists"],
+    )
 
     release = result.get("release", {})
     tracks = []
@@ -232,7 +333,7 @@ def fetch_release_tracks(release_id: str) -> Optional[list[dict]]:
                 }
             )
 
-    return tracks
+    return tuple(tracks)
 
 
 def find_track_number(
@@ -1,9 +1,15 @@
 """폴더 구조 및 파일명 정리 모듈"""
 
+import ctypes
+import errno
+import functools
+import os
 import re
 import shutil
+import sys
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, Union
 
 from .metadata import TrackMetadata
 
@@ -15,10 +21,22 @@ class OrganizerError(Exception):
 
 
 # 파일명에 사용할 수 없는 문자 (Windows 호환성)
-INVALID_CHARS = r'[<>:"/\\|?*]'
-INVALID_CHARS_PATTERN = re.compile(INVALID_CHARS)
+INVALID_CHARS = '<>:"/\\|?*'
+_INVALID_CHARS_TABLE = str.maketrans("", "", INVALID_CHARS)
+_WHITESPACE_PATTERN = re.compile(r"\s+")
 
+# 파일명 최대 길이 (255바이트 제한 고려)
+_MAX_NAME_BYTES = 200
 
+# 변수 딕셔너리를 받아 경로 문자열을 만드는 템플릿 함수
+TemplateFormatter = Callable[[dict], str]
+
+# 병렬 처리 시 폴더 생성/대상 이름 선점과 빈 폴더 삭제가 서로 엇갈리지 않도록 보호
+# (파일 복사/이동 자체는 lock 밖에서 수행)
+_fs_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4096)
 def sanitize_filename(name: str) -> str:
     """
     파일명에서 사용할 수 없는 문자를 제거합니다.
@@ -33,25 +51,41 @@ def sanitize_filename(name: str) -> str:
         return "Unknown"
 
     # 유효하지 않은 문자 제거
-    sanitized = INVALID_CHARS_PATTERN.sub("", name)
+    sanitized = name.translate(_INVALID_CHARS_TABLE)
 
     # 앞뒤 공백 및 점 제거
     sanitized = sanitized.strip(" .")
 
     # 연속된 공백을 하나로
-    sanitized = re.sub(r"\s+", " ", sanitized)
+    sanitized = _WHITESPACE_PATTERN.sub(" ", sanitized)
 
-    # 너무 긴 이름 자르기 (255바이트 제한 고려)
-    if len(sanitized.encode("utf-8")) > 200:
-        while len(sanitized.encode("utf-8")) > 200:
-            sanitized = sanitized[:-1]
-        sanitized = sanitized.strip()
+    # 너무 긴 이름 자르기 (잘린 multibyte 문자는 버림)
+    encoded = sanitized.encode("utf-8")
+    if len(encoded) > _MAX_NAME_BYTES:
+        sanitized = encoded[:_MAX_NAME_BYTES].decode("utf-8", "ignore").strip()
 
     return sanitized or "Unknown"
 
 
+@functools.lru_cache(maxsize=32)
+def compile_template(template: str) -> TemplateFormatter:
+    """
+    템플릿 문자열을 변수 딕셔너리를 받는 포맷 함수로 변환합니다.
+
+    파일마다 변수 딕셔너리를 키워드 인자로 풀어 복사하지 않도록 format_map을
+    미리 바인딩합니다. 포맷 오류는 str.format과 같은 KeyError/ValueError입니다.
+    """
+    return template.format_map
+
+
+def _as_formatter(template: Union[str, TemplateFormatter]) -> TemplateFormatter:
+    return compile_template(template) if isinstance(template, str) else template
+
+
 def build_folder_path(
-    base_path: Path, metadata: TrackMetadata, template: str = "{artist}/{album}"
+    base_path: Path,
+    metadata: TrackMetadata,
+    template: Union[str, TemplateFormatter] = "{artist}/{album}",
 ) -> Path:
     """
     메타데이터를 기반으로 폴더 경로를 생성합니다.
@@ -59,7 +93,7 @@ def build_folder_path(
     Args:
         base_path: 기본 경로
         metadata: 트랙 메타데이터
-        template: 폴더 구조 템플릿
+        template: 폴더 구조 템플릿 (문자열 또는 compile_template 결과)
 
     Returns:
         생성할 폴더 경로
@@ -74,7 +108,7 @@ def build_folder_path(
 
     # 템플릿 적용
     try:
-        folder_structure = template.format(**variables)
+        folder_structure = _as_formatter(template)(variables)
     except KeyError as e:
         raise OrganizerError(f"잘못된 템플릿 변수: {e}")
 
@@ -82,14 +116,15 @@ def build_folder_path(
 
 
 def build_filename(
-    metadata: TrackMetadata, template: str = "{track:02d} - {title}"
+    metadata: TrackMetadata,
+    template: Union[str, TemplateFormatter] = "{track:02d} - {title}",
 ) -> str:
     """
     메타데이터를 기반으로 파일명을 생성합니다.
 
     Args:
         metadata: 트랙 메타데이터
-        template: 파일명 템플릿
+        template: 파일명 템플릿 (문자열 또는 compile_template 결과)
 
     Returns:
         새 파일명 (.mp3 확장자 포함)
@@ -107,7 +142,7 @@ def build_filename(
     # 템플릿 적용
     try:
         # track:02d 같은 포맷 문자열 처리
-        filename = template.format(**variables)
+        filename = _as_formatter(template)(variables)
     except (KeyError, ValueError):
         # 포맷 실패 시 기본 형식 사용
         if track_num:
@@ -121,8 +156,8 @@ def build_filename(
 def get_new_path(
     base_path: Path,
     metadata: TrackMetadata,
-    folder_template: str = "{artist}/{album}",
-    filename_template: str = "{track:02d} - {title}",
+    folder_template: Union[str, TemplateFormatter] = "{artist}/{album}",
+    filename_template: Union[str, TemplateFormatter] = "{track:02d} - {title}",
 ) -> Path:
     """
     파일의 새 경로를 계산합니다.
@@ -130,8 +165,8 @@ def get_new_path(
     Args:
         base_path: 기본 출력 경로
         metadata: 트랙 메타데이터
-        folder_template: 폴더 구조 템플릿
-        filename_template: 파일명 템플릿
+        folder_template: 폴더 구조 템플릿 (문자열 또는 compile_template 결과)
+        filename_template: 파일명 템플릿 (문자열 또는 compile_template 결과)
 
     Returns:
         새 파일 전체 경로
@@ -172,54 +207,172 @@ def move_file(
         return result
 
     if not dry_run:
-        # 대상 폴더 생성
-        destination.parent.mkdir(parents=True, exist_ok=True)
-
-        # 중복 파일 처리
-        if destination.exists():
-            destination = _handle_duplicate(destination)
-            result["destination"] = str(destination)
-
-        # 백업
-        if backup_path:
-            backup_file = backup_path / source.name
-            backup_path.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source, backup_file)
-            result["backed_up"] = True
-            result["backup_location"] = str(backup_file)
-
-        # 이동
-        shutil.move(str(source), str(destination))
-        result["moved"] = True
+        with _fs_lock:
+            # 대상 폴더 생성 후 빈 파일로 대상 이름을 선점 (중복이면 번호 붙이기)
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            reserved = _handle_duplicate(destination)
+            if reserved != destination:
+                destination = reserved
+                result["destination"] = str(destination)
+
+        try:
+            # 백업
+            if backup_path:
+                backup_file = backup_path / source.name
+                backup_path.mkdir(parents=True, exist_ok=True)
+                _copy_for_backup(source, backup_file)
+                result["backed_up"] = True
+                result["backup_location"] = str(backup_file)
+
+            # 이동 (선점해 둔 빈 파일을 덮어씀)
+            _rename_or_copy(source, destination)
+            result["moved"] = True
+        except BaseException:
+            # 이동하지 못했으면 선점한 빈 파일(또는 덜 복사된 파일)을 정리
+            try:
+                destination.unlink()
+            except OSError:
+                pass
+            raise
 
         # 원본 폴더가 비었으면 삭제
-        _cleanup_empty_folders(source.parent)
+        with _fs_lock:
+            _cleanup_empty_folders(source.parent)
 
     return result
 
 
+def _rename_or_copy(source: Path, destination: Path) -> None:
+    """
+    같은 파일시스템이면 rename으로 이동하고, 다른 장치면 복사 후 원본을 삭제합니다.
+    """
+    try:
+        os.replace(source, destination)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        _fast_copy(source, destination)
+        # 복사본이 원본과 크기가 다르면 불완전한 복사본만 지우고 원본은 남김
+        if os.stat(destination).st_size != os.stat(source).st_size:
+            os.unlink(destination)
+            raise OSError(errno.EIO, f"복사된 파일 크기가 원본과 다릅니다: {destination}")
+        os.unlink(source)
+
+
+# 일반 복사 시 read/write 한 번에 처리할 크기 (MP3 한 곡이 몇 번에 끝나도록)
+_COPY_BUFSIZE = 8 * 1024 * 1024
+
+
+def _fast_copy(source: Path, destination: Path) -> None:
+    """
+    파일 내용과 메타데이터를 복사합니다 (shutil.copy2 대체).
+
+    Linux에서는 copy_file_range로 커널 안에서 복사하고, 지원하지 않으면
+    큰 버퍼로 복사하여 시스템 콜 횟수를 줄입니다.
+    """
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        copied = False
+        if hasattr(os, "copy_file_range"):
+            size = os.fstat(src.fileno()).st_size
+            total = 0
+            try:
+                while n := os.copy_file_range(src.fileno(), dst.fileno(), _COPY_BUFSIZE):
+                    total += n
+                # 일부 커널/파일시스템 조합은 다른 장치 간 복사에서 일찍 0을 반환하므로 크기 확인
+                copied = total == size
+            except OSError:
+                pass
+            if not copied:
+                # 지원하지 않거나 덜 복사되었으면 처음부터 버퍼 복사로 대체
+                src.seek(0)
+                dst.seek(0)
+                dst.truncate()
+        if not copied:
+            shutil.copyfileobj(src, dst, _COPY_BUFSIZE)
+
+    shutil.copystat(source, destination)
+
+
+# Linux FICLONE ioctl (Btrfs/XFS 등에서 데이터 블록을 공유하는 reflink 복사)
+_FICLONE = 0x40049409
+
+
+def _clone_file(source: Path, destination: Path) -> bool:
+    """
+    가능하면 reflink/clonefile로 데이터 복사 없이 파일을 복제합니다.
+
+    하드링크와 달리 복제본은 이후 원본의 태그 수정에 영향을 받지 않습니다.
+
+    Returns:
+        복제 성공 여부 (지원하지 않는 파일시스템이면 False)
+    """
+    try:
+        if sys.platform.startswith("linux"):
+            import fcntl
+
+            with open(source, "rb") as src, open(destination, "wb") as dst:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            shutil.copystat(source, destination)
+            return True
+
+        if sys.platform == "darwin":
+            # APFS clonefile()은 대상이 이미 있으면 실패하므로 먼저 삭제
+            if destination.exists():
+                destination.unlink()
+            libc = ctypes.CDLL(None, use_errno=True)
+            if libc.clonefile(os.fsencode(source), os.fsencode(destination), 0) == 0:
+                return True
+    except (OSError, AttributeError):
+        pass
+
+    try:
+        destination.unlink()
+    except OSError:
+        pass
+    return False
+
+
+def _copy_for_backup(source: Path, destination: Path) -> None:
+    """백업 복사본을 만듭니다 (reflink 우선, 실패 시 일반 복사)."""
+    if not _clone_file(source, destination):
+        _fast_copy(source, destination)
+
+
 def _handle_duplicate(path: Path) -> Path:
-    """중복 파일명 처리 - 번호 붙이기"""
+    """
+    중복 파일명 처리 - 번호 붙이기
+
+    O_CREAT | O_EXCL로 빈 파일을 만들어 이름을 선점하므로, 여러 워커가 동시에
+    같은 이름을 골라도 서로 덮어쓰지 않습니다.
+
+    Returns:
+        선점한 경로 (이미 빈 파일이 만들어져 있음)
+    """
     stem = path.stem
     suffix = path.suffix
     parent = path.parent
 
     counter = 1
     new_path = path
-    while new_path.exists():
-        new_path = parent / f"{stem} ({counter}){suffix}"
-        counter += 1
-
-    return new_path
+    while True:
+        try:
+            fd = os.open(new_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            new_path = parent / f"{stem} ({counter}){suffix}"
+            counter += 1
+            continue
+        os.close(fd)
+        return new_path
 
 
 def _cleanup_empty_folders(folder: Path) -> None:
     """빈 폴더를 재귀적으로 삭제합니다."""
+    # 비어 있지 않거나 없는 폴더는 rmdir가 OSError로 알려주므로 따로 확인하지 않음
     try:
-        while folder.exists() and not any(folder.iterdir()):
-            folder.rmdir()
+        while True:
+            os.rmdir(folder)
             folder = folder.parent
-    except (OSError, PermissionError):
+    except OSError:
         pass
 
 
@@ -227,8 +380,8 @@ def organize_file(
     file_path: Path,
     metadata: TrackMetadata,
     output_path: Path,
-    folder_template: str = "{artist}/{album}",
-    filename_template: str = "{track:02d} - {title}",
+    folder_template: Union[str, TemplateFormatter] = "{artist}/{album}",
+    filename_template: Union[str, TemplateFormatter] = "{track:02d} - {title}",
     dry_run: bool = False,
     backup_path: Optional[Path] = None,
 ) -> dict:
@@ -239,8 +392,8 @@ def organize_file(
         file_path: 원본 파일 경로
         metadata: 트랙 메타데이터
         output_path: 출력 기본 경로
-        folder_template: 폴더 구조 템플릿
-        filename_template: 파일명 템플릿
+        folder_template: 폴더 구조 템플릿 (문자열 또는 compile_template 결과)
+        filename_template: 파일명 템플릿 (문자열 또는 compile_template 결과)
         dry_run: True면 실제 변경 없음
         backup_path: 백업 경로
 
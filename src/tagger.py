@@ -1,7 +1,10 @@
 """ID3 태그 업데이트 모듈"""
 
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 from mutagen.id3 import (
     ID3,
@@ -22,13 +25,48 @@ from mutagen.mp3 import MP3
 from .metadata import TrackMetadata
 
 
+# 읽어올 ID3 프레임과 결과 키 (TDRC가 TYER보다 뒤에 있어 v2.4 값이 우선)
+_TAG_MAPPING = (
+    ("TIT2", "title"),
+    ("TPE1", "artist"),
+    ("TPE2", "album_artist"),
+    ("TALB", "album"),
+    ("TRCK", "track"),
+    ("TPOS", "disc"),
+    ("TYER", "year"),
+    ("TDRC", "year"),
+    ("TCON", "genre"),
+)
+
+# 결과 키별로 확인할 프레임 ID (우선순위 순, _TAG_MAPPING에서 뒤에 있는 프레임이 우선)
+_KEY_TO_FRAMES: dict[str, tuple[str, ...]] = {}
+for _tag_id, _key in reversed(_TAG_MAPPING):
+    _KEY_TO_FRAMES[_key] = _KEY_TO_FRAMES.get(_key, ()) + (_tag_id,)
+del _tag_id, _key
+
+# update_tags에서 메타데이터 값을 그대로 기록하는 태그: (메타데이터 필드/결과 키, 프레임 ID, 프레임 클래스)
+_UPDATE_SPEC = (
+    ("title", "TIT2", TIT2),
+    ("artist", "TPE1", TPE1),
+    ("album_artist", "TPE2", TPE2),
+    ("album", "TALB", TALB),
+    ("genre", "TCON", TCON),
+)
+
+# 태그 저장 시 최소로 남겨둘 패딩 (바이트)
+_MIN_TAG_PADDING = 4096
+
+# update_tags_bulk에서 프로세스 간 전달 비용을 줄이기 위해 한 번에 넘길 파일 수
+_BULK_CHUNKSIZE = 16
+
+
 class TaggerError(Exception):
     """태그 업데이트 관련 에러"""
 
     pass
 
 
-def read_current_tags(file_path: Path) -> dict:
+def read_current_tags(file_path: Union[str, Path]) -> dict:
     """
     현재 MP3 파일의 ID3 태그를 읽습니다.
 
@@ -38,98 +76,188 @@ def read_current_tags(file_path: Path) -> dict:
     Returns:
         현재 태그 정보 딕셔너리
     """
+    # 태그만 필요하므로 MP3 대신 ID3만 읽고, 버전 변환과 ID3v1 읽기는 생략
     try:
-        audio = MP3(str(file_path))
+        id3_tags = ID3(os.fspath(file_path), translate=False, load_v1=False)
+    except ID3NoHeaderError:
+        return {}
     except Exception as e:
         raise TaggerError(f"파일을 읽을 수 없습니다: {file_path} - {e}")
 
+    # ID3v2.2는 프레임 ID가 달라서(TT2 등) 이 경우에만 변환
+    if id3_tags.version < (2, 3, 0):
+        id3_tags.update_to_v24()
+
+    return _extract_tags_dict(id3_tags)
+
+
+def _extract_tags_dict(id3_tags: Optional[ID3]) -> dict:
+    """이미 읽은 ID3 태그 객체에서 주요 태그 딕셔너리를 만듭니다."""
     tags = {}
 
-    if audio.tags is None:
+    if id3_tags is None:
         return tags
 
     # 주요 태그 읽기
-    tag_mapping = {
-        "TIT2": "title",
-        "TPE1": "artist",
-        "TPE2": "album_artist",
-        "TALB": "album",
-        "TRCK": "track",
-        "TPOS": "disc",
-        "TYER": "year",
-        "TDRC": "year",
-        "TCON": "genre",
-    }
-
-    for tag_id, key in tag_mapping.items():
-        if tag_id in audio.tags:
-            value = str(audio.tags[tag_id].text[0])
-            if key == "year" and value:
-                try:
-                    tags[key] = int(str(value)[:4])
-                except ValueError:
-                    tags[key] = value
-            else:
-                tags[key] = value
+    for tag_id, key in _TAG_MAPPING:
+        frame = id3_tags.get(tag_id)
+        if frame is not None:
+            tags[key] = _frame_value(key, frame)
 
     return tags
 
 
-def update_tags(
-    file_path: Path, metadata: TrackMetadata, dry_run: bool = False
-) -> dict:
+def _frame_value(key: str, frame) -> Union[str, int]:
+    """프레임의 첫 번째 값을 read_current_tags 형식으로 변환합니다 (연도는 정수)."""
+    value = str(frame.text[0])
+    if key == "year" and value:
+        try:
+            return int(value[:4])
+        except ValueError:
+            return value
+    return value
+
+
+class _CurrentTags:
     """
-    MP3 파일의 ID3 태그를 업데이트합니다.
+    ID3 객체를 감싸 필요한 태그만 그때그때 읽는 read_current_tags 대체용 객체.
+
+    update_tags는 몇 개 키만 get으로 비교하므로 딕셔너리를 미리 만들지 않습니다.
+    load_current_tags로 만들면 연 MP3 객체도 함께 들고 있어 update_tags가 재사용합니다.
+    """
+
+    __slots__ = ("_tags", "_audio")
+
+    def __init__(self, id3_tags: Optional[ID3], audio: Optional[MP3] = None):
+        self._tags = id3_tags
+        self._audio = audio
+
+    def get(self, key: str, default=None):
+        if self._tags is None:
+            return default
+        for tag_id in _KEY_TO_FRAMES[key]:
+            frame = self._tags.get(tag_id)
+            if frame is not None:
+                return _frame_value(key, frame)
+        return default
+
+
+def load_current_tags(file_path: Union[str, Path]) -> _CurrentTags:
+    """
+    MP3 파일을 한 번 열어 tags_up_to_date와 update_tags에 함께 넘길 태그 객체를 만듭니다.
 
     Args:
         file_path: MP3 파일 경로
-        metadata: 적용할 메타데이터
-        dry_run: True면 실제 저장하지 않음
 
     Returns:
-        변경 사항 딕셔너리
+        현재 태그와 연 MP3 객체를 담은 _CurrentTags
     """
     try:
-        audio = MP3(str(file_path))
+        audio = MP3(os.fspath(file_path))
     except Exception as e:
         raise TaggerError(f"파일을 읽을 수 없습니다: {file_path} - {e}")
+    return _CurrentTags(audio.tags, audio)
 
-    # ID3 태그가 없으면 생성
-    try:
-        tags = audio.tags or ID3()
-    except ID3NoHeaderError:
-        tags = ID3()
 
-    changes = {}
-    old_tags = read_current_tags(file_path)
+def _expected_tag_values(metadata: TrackMetadata) -> dict:
+    """update_tags가 기록할 값을 read_current_tags와 같은 키/형식으로 반환합니다."""
+    expected = {}
 
-    # Title
     if metadata.title:
-        old_val = old_tags.get("title", "")
-        if old_val != metadata.title:
-            tags["TIT2"] = TIT2(encoding=3, text=metadata.title)
-            changes["title"] = {"old": old_val, "new": metadata.title}
-
-    # Artist
+        expected["title"] = metadata.title
     if metadata.artist:
-        old_val = old_tags.get("artist", "")
-        if old_val != metadata.artist:
-            tags["TPE1"] = TPE1(encoding=3, text=metadata.artist)
-            changes["artist"] = {"old": old_val, "new": metadata.artist}
-
-    # Album Artist
+        expected["artist"] = metadata.artist
     if metadata.album_artist:
-        old_val = old_tags.get("album_artist", "")
-        if old_val != metadata.album_artist:
-            tags["TPE2"] = TPE2(encoding=3, text=metadata.album_artist)
-            changes["album_artist"] = {"old": old_val, "new": metadata.album_artist}
-
-    # Album
+        expected["album_artist"] = metadata.album_artist
     if metadata.album:
-        old_val = old_tags.get("album", "")
-        if old_val != metadata.album:
-            tags["TALB"] = TALB(encoding=3, text=metadata.album)
-            changes["album"] = {"old": old_val, "new": metadata.album}
+        expected["album"] = metadata.album
+    if metadata.track_number:
+        if metadata.total_tracks:
+            expected["track"] = f"{metadata.track_number}/{metadata.total_tracks}"
+        else:
+            expected["track"] = str(metadata.track_number)
+    if metadata.disc_number:
+        expected["disc"] = str(metadata.disc_number)
+    if metadata.year:
+        expected["year"] = metadata.year
+    if metadata.genre:
+        expected["genre"] = metadata.genre
+
+    return expected
+
+
+def tags_up_to_date(
+    current_tags: Union[dict, _CurrentTags], metadata: TrackMetadata
+) -> bool:
+    """
+    현재 태그가 이미 메타데이터와 같아서 update_tags가 바꿀 것이 없는지 확인합니다.
+
+    Args:
+        current_tags: read_current_tags 또는 load_current_tags 결과
+        metadata: 적용할 메타데이터
+    """
+    return all(
+        current_tags.get(key) == value
+        for key, value in _expected_tag_values(metadata).items()
+    )
+
+
+def _tag_padding(info) -> int:
+    """
+    mutagen 저장 시 패딩 크기를 정합니다.
+
+    새 태그가 기존 공간에 들어가면 남은 패딩을 그대로 써서 파일을 다시 쓰지 않고,
+    들어가지 않아 어차피 다시 써야 할 때는 다음 수정에 대비해 넉넉히 남깁니다.
+    """
+    if info.padding >= 0:
+        return info.padding
+    return _MIN_TAG_PADDING
+
+
+def update_tags(
+    file_path: Union[str, Path],
+    metadata: TrackMetadata,
+    dry_run: bool = False,
+    current_tags: Optional[Union[dict, _CurrentTags]] = None,
+) -> dict:
+    """
+    MP3 파일의 ID3 태그를 업데이트합니다.
+
+    Args:
+        file_path: MP3 파일 경로
+        metadata: 적용할 메타데이터
+        dry_run: True면 실제 저장하지 않음
+        current_tags: 이미 읽은 read_current_tags 또는 load_current_tags 결과
+            (load_current_tags 결과면 그때 연 파일을 다시 파싱하지 않음)
+
+    Returns:
+        변경 사항 딕셔너리
+    """
+    # 기록할 기본 태그가 하나도 없으면 저장할 일도 없으므로 파일을 열지 않음
+    if not _expected_tag_values(metadata):
+        return {}
+
+    if isinstance(current_tags, _CurrentTags) and current_tags._audio is not None:
+        audio = current_tags._audio
+    else:
+        audio = load_current_tags(file_path)._audio
+
+    # ID3 태그가 없으면 생성
+    tags = audio.tags if audio.tags is not None else ID3()
+
+    changes = {}
+    # 이미 연 파일의 태그를 그대로 사용 (파일을 다시 파싱하지 않음)
+    old_tags = current_tags if current_tags is not None else _CurrentTags(audio.tags)
+
+    # 문자열 그대로 기록하는 태그 (Title, Artist, Album Artist, Album, Genre)
+    for attr, frame_id, frame_cls in _UPDATE_SPEC:
+        new_val = getattr(metadata, attr)
+        if not new_val:
+            continue
+        old_val = old_tags.get(attr, "")
+        if old_val != new_val:
+            tags[frame_id] = frame_cls(encoding=3, text=new_val)
+            changes[attr] = {"old": old_val, "new": new_val}
 
     # Track Number
     if metadata.track_number:
@@ -149,45 +277,157 @@ def update_tags(
             tags["TPOS"] = TPOS(encoding=3, text=disc_str)
             changes["disc"] = {"old": old_val, "new": disc_str}
 
-    # Year
+    # Year (연도는 정수로 비교하므로 "2001-05-01" 같은 날짜 태그도 같은 값으로 봄)
     if metadata.year:
         old_val = old_tags.get("year")
+        if isinstance(old_val, str):
+            old_val = int(old_val[:4]) if old_val[:4].isdigit() else old_val
         if old_val != metadata.year:
             tags["TDRC"] = TDRC(encoding=3, text=str(metadata.year))
             changes["year"] = {"old": old_val, "new": metadata.year}
 
-    # Genre
-    if metadata.genre:
-        old_val = old_tags.get("genre", "")
-        if old_val != metadata.genre:
-            tags["TCON"] = TCON(encoding=3, text=metadata.genre)
-            changes["genre"] = {"old": old_val, "new": metadata.genre}
-
-    # MusicBrainz IDs (사용자 정의 태그)
-    if metadata.musicbrainz_recording_id:
-        tags["TXXX:MusicBrainz Recording Id"] = TXXX(
-            encoding=3,
-            desc="MusicBrainz Recording Id",
-            text=metadata.musicbrainz_recording_id,
-        )
-
-    if metadata.musicbrainz_release_id:
-        tags["TXXX:MusicBrainz Release Id"] = TXXX(
-            encoding=3,
-            desc="MusicBrainz Release Id",
-            text=metadata.musicbrainz_release_id,
-        )
-
-    # 저장
+    # MusicBrainz IDs (사용자 정의 태그, 같은 값이면 프레임을 새로 만들지 않음)
+    for desc, value in (
+        ("MusicBrainz Recording Id", metadata.musicbrainz_recording_id),
+        ("MusicBrainz Release Id", metadata.musicbrainz_release_id),
+    ):
+        if not value:
+            continue
+        frame = tags.get(f"TXXX:{desc}")
+        if frame is None or list(frame.text) != [value]:
+            tags[f"TXXX:{desc}"] = TXXX(encoding=3, desc=desc, text=value)
+
+    # 저장 (패딩을 넉넉히 남겨 다음에 태그가 조금 늘어나도 오디오 데이터를 다시 쓰지 않게 함)
     if changes and not dry_run:
         audio.tags = tags
-        audio.save()
+        audio.save(padding=_tag_padding)
 
     return changes
 
 
-def has_complete_tags(file_path: Path) -> bool:
+def update_tags_bulk(
+    items: list[tuple[Union[str, Path], TrackMetadata]],
+    dry_run: bool = False,
+    workers: Optional[int] = None,
+) -> list[Union[dict, TaggerError]]:
+    """
+    여러 파일의 태그를 프로세스 풀에서 병렬로 업데이트합니다.
+
+    mutagen의 프레임 파싱은 순수 Python이라 스레드로는 GIL 때문에 빨라지지
+    않으므로, 태그만 일괄로 바꿀 때는 프로세스를 나눠서 처리합니다.
+
+    Args:
+        items: (파일 경로, 적용할 메타데이터) 목록
+        dry_run: True면 실제 저장하지 않음
+        workers: 프로세스 수 (기본: CPU 코어 수)
+
+    Returns:
+        items와 같은 순서의 변경 사항 딕셔너리 목록. 실패한 파일은 TaggerError 객체
+    """
+    if not items:
+        return []
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        return list(
+            executor.map(
+                functools.partial(_update_one, dry_run=dry_run),
+                items,
+                chunksize=_BULK_CHUNKSIZE,
+            )
+        )
+
+
+def _update_one(
+    item: tuple[Union[str, Path], TrackMetadata], dry_run: bool = False
+) -> Union[dict, TaggerError]:
+    """update_tags_bulk 작업 프로세스에서 파일 하나를 처리합니다."""
+    file_path, metadata = item
+    try:
+        return update_tags(file_path, metadata, dry_run=dry_run)
+    except TaggerError as e:
+        return e
+    except Exception as e:
+        return TaggerError(f"태그를 저장할 수 없습니다: {file_path} - {e}")
+
+
+# 완전한 태그로 보기 위해 필요한 기본 태그
+_REQUIRED_TAGS = ("title", "artist", "album")
+_REQUIRED_FRAMES = frozenset({"TIT2", "TPE1", "TALB"})
+
+
+def _quick_tag_presence(file_path: Union[str, Path]) -> Optional[set[str]]:
+    """
+    ID3v2 헤더를 직접 읽어 내용이 있는 프레임 ID 집합을 반환합니다.
+
+    mutagen처럼 모든 프레임을 디코딩하지 않고 프레임 헤더만 훑습니다.
+    ID3v2.3/2.4가 아니거나 전체 unsynchronisation처럼 바로 읽기 어려운
+    경우에는 None을 반환합니다 (호출하는 쪽에서 mutagen으로 처리).
+    """
+    with open(file_path, "rb") as f:
+        header = f.read(10)
+        if len(header) < 10 or header[:3] != b"ID3":
+            return None
+
+        version, flags = header[3], header[5]
+        if version not in (3, 4) or flags & 0x80:
+            return None
+
+        size = _synchsafe(header[6:10])
+        data = f.read(size)
+
+    pos = 0
+    if flags & 0x40:
+        # 확장 헤더 건너뛰기 (v2.4는 크기에 자기 자신 포함, v2.3은 미포함)
+        if version == 4:
+            pos = _synchsafe(data[:4])
+        else:
+            pos = int.from_bytes(data[:4], "big") + 4
+
+    frames = set()
+    end = len(data)
+    while pos + 10 <= end:
+        frame_id = data[pos:pos + 4]
+        if not frame_id.isalnum():
+            # 패딩 또는 손상된 헤더
+            break
+        if version == 4:
+            frame_size = _synchsafe(data[pos + 4:pos + 8])
+        else:
+            frame_size = int.from_bytes(data[pos + 4:pos + 8], "big")
+        body = data[pos + 10:pos + 10 + frame_size]
+        # 인코딩 바이트 뒤에 실제 글자가 있어야 값이 있는 것으로 봄
+        if body[1:].strip(b"\x00\xff\xfe"):
+            frames.add(frame_id.decode("ascii"))
+        pos += 10 + frame_size
+
+    return frames
+
+
+def _synchsafe(data: bytes) -> int:
+    """ID3v2 synchsafe 정수(바이트당 7비트)를 해석합니다."""
+    return (data[0] << 21) | (data[1] << 14) | (data[2] << 7) | data[3]
+
+
+def has_complete_tags(file_path: Union[str, Path]) -> bool:
     """파일이 기본 태그(title, artist, album)를 모두 가지고 있는지 확인합니다."""
-    tags = read_current_tags(file_path)
-    required = ["title", "artist", "album"]
-    return all(tags.get(key) for key in required)
+    try:
+        frames = _quick_tag_presence(file_path)
+    except OSError as e:
+        raise TaggerError(f"파일을 읽을 수 없습니다: {file_path} - {e}")
+    if frames is not None:
+        return _REQUIRED_FRAMES <= frames
+
+    # 태그만 필요하므로 MP3 대신 ID3만 읽어 오디오 프레임 탐색을 생략
+    try:
+        id3_tags = ID3(os.fspath(file_path))
+    except ID3NoHeaderError:
+        return False
+    except Exception as e:
+        raise TaggerError(f"파일을 읽을 수 없습니다: {file_path} - {e}")
+
+    return has_complete_tags_from_tags(_extract_tags_dict(id3_tags))
+
+
+def has_complete_tags_from_tags(tags: dict) -> bool:
+    """read_current_tags 결과에 기본 태그(title, artist, album)가 모두 있는지 확인합니다."""
+    return all(tags.get(key) for key in _REQUIRED_TAGS)
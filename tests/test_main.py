@@ -0,0 +1,56 @@
+"""main 모듈 테스트"""
+
+import logging
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src import main
+
+
+class BatchingMemoryHandlerTest(unittest.TestCase):
+    """_BatchingMemoryHandler 오류 처리 테스트"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.log_file = Path(self._tmp.name) / "organizer.log"
+        self.target = logging.FileHandler(self.log_file, encoding="utf-8")
+        self.handler = main._BatchingMemoryHandler(
+            capacity=1024, flushLevel=logging.ERROR, target=self.target
+        )
+        self.logger = logging.Logger("test-batching")
+        self.logger.addHandler(self.handler)
+        # handleError는 stderr로 트레이스백만 출력하므로 테스트에서는 기록만 확인
+        patcher = mock.patch.object(self.handler, "handleError")
+        self.handle_error = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.handler.close()
+        self.target.close()
+        self._tmp.cleanup()
+
+    def test_bad_record_does_not_drop_others(self):
+        self.logger.info("bad %d", "x")
+        self.logger.info("ok")
+        self.logger.error("an error")
+
+        text = self.log_file.read_text(encoding="utf-8")
+        self.assertIn("ok", text)
+        self.assertIn("an error", text)
+        self.assertEqual(self.handle_error.call_count, 1)
+        self.assertEqual(self.handler.buffer, [])
+
+    def test_write_error_is_handled(self):
+        with mock.patch.object(
+            self.target.stream, "write", side_effect=OSError(28, "No space left on device")
+        ):
+            self.logger.error("disk full")
+
+        self.assertEqual(self.handle_error.call_count, 1)
+        self.assertEqual(self.handler.buffer, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
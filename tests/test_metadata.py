@@ -0,0 +1,86 @@
+"""metadata 모듈 테스트"""
+
+import threading
+import time
+import unittest
+from unittest import mock
+
+from src import metadata
+
+
+def _release_xml(release_id: str) -> bytes:
+    """get_release_by_id가 파싱하는 MusicBrainz 응답 (트랙 하나짜리 릴리스)"""
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<metadata xmlns="http://musicbrainz.org/ns/mmd-2.0#">'
+        f'<release id="{release_id}"><medium-list count="1"><medium>'
+        '<position>1</position><track-list count="1"><track id="t1">'
+        f'<position>1</position><recording id="{release_id}-rec"><title>T</title></recording>'
+        "</track></track-list></medium></medium-list></release></metadata>"
+    ).encode()
+
+
+def _release_id_from(req) -> str:
+    return req.get_full_url().split("/ws/2/release/")[1].split("?")[0]
+
+
+class FetchReleaseTracksTest(unittest.TestCase):
+    """fetch_release_tracks 동시 조회 테스트"""
+
+    def setUp(self):
+        metadata._fetch_release_tracks_cached.cache_clear()
+        patcher = mock.patch.object(metadata, "_rate_limit")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(metadata._fetch_release_tracks_cached.cache_clear)
+
+    def _run_threads(self, release_ids: list[str]) -> list:
+        results = [None] * len(release_ids)
+
+        def worker(index: int, release_id: str) -> None:
+            results[index] = metadata.fetch_release_tracks(release_id)
+
+        threads = [
+            threading.Thread(target=worker, args=(i, release_id))
+            for i, release_id in enumerate(release_ids)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        return results
+
+    def test_different_releases_fetch_concurrently(self):
+        # HTTP 요청 두 개가 동시에 진행 중이어야만 barrier를 통과함
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_safe_read(opener, req, body=None, *args, **kwargs):
+            barrier.wait()
+            return _release_xml(_release_id_from(req))
+
+        with mock.patch.object(metadata.musicbrainzngs.musicbrainz, "_safe_read", fake_safe_read):
+            results = self._run_threads(["release-a", "release-b"])
+
+        self.assertFalse(barrier.broken)
+        self.assertEqual(results[0][0]["recording_id"], "release-a-rec")
+        self.assertEqual(results[1][0]["recording_id"], "release-b-rec")
+
+    def test_same_release_is_fetched_once(self):
+        requests = []
+
+        def fake_safe_read(opener, req, body=None, *args, **kwargs):
+            requests.append(req.get_full_url())
+            time.sleep(0.2)
+            return _release_xml(_release_id_from(req))
+
+        with mock.patch.object(metadata.musicbrainzngs.musicbrainz, "_safe_read", fake_safe_read):
+            results = self._run_threads(["release-a"] * 5)
+
+        self.assertEqual(len(requests), 1)
+        for tracks in results:
+            self.assertEqual(len(tracks), 1)
+            self.assertEqual(tracks[0]["recording_id"], "release-a-rec")
+            self.assertEqual(tracks[0]["track_number"], 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,229 @@
+"""organizer 모듈 테스트"""
+
+import errno
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src import organizer
+
+
+class MoveFileBackupTest(unittest.TestCase):
+    """move_file 백업 경로 테스트"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.source = self.root / "in" / "song.mp3"
+        self.source.parent.mkdir()
+        self.source.write_bytes(b"ID3" + b"\x00" * 1024)
+        self.destination = self.root / "out" / "Artist" / "song.mp3"
+        self.backup_path = self.root / ".backup"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_backup_uses_clone_when_supported(self):
+        with mock.patch.object(organizer, "_clone_file", return_value=True) as clone, \
+                mock.patch.object(organizer, "_fast_copy") as fast_copy:
+            result = organizer.move_file(
+                self.source, self.destination, backup_path=self.backup_path
+            )
+
+        clone.assert_called_once_with(self.source, self.backup_path / "song.mp3")
+        fast_copy.assert_not_called()
+        self.assertTrue(result["backed_up"])
+        self.assertTrue(result["moved"])
+        self.assertTrue(self.destination.exists())
+
+    def test_backup_falls_back_to_copy_when_clone_fails(self):
+        backup_file = self.backup_path / "song.mp3"
+        with mock.patch.object(organizer, "_clone_file", return_value=False) as clone, \
+                mock.patch.object(
+                    organizer, "_fast_copy", wraps=organizer._fast_copy
+                ) as fast_copy:
+            result = organizer.move_file(
+                self.source, self.destination, backup_path=self.backup_path
+            )
+
+        clone.assert_called_once_with(self.source, backup_file)
+        fast_copy.assert_called_once_with(self.source, backup_file)
+        self.assertTrue(result["backed_up"])
+        self.assertEqual(result["backup_location"], str(backup_file))
+        self.assertEqual(backup_file.read_bytes(), self.destination.read_bytes())
+
+    def test_backup_fallback_keeps_copystat_metadata(self):
+        os.chmod(self.source, 0o640)
+        os.utime(self.source, ns=(1_000_000_000_000_000_000, 1_200_000_000_000_000_000))
+        source_stat = self.source.stat()
+
+        with mock.patch.object(organizer, "_clone_file", return_value=False):
+            organizer.move_file(self.source, self.destination, backup_path=self.backup_path)
+
+        backup_stat = (self.backup_path / "song.mp3").stat()
+        self.assertEqual(backup_stat.st_mtime_ns, source_stat.st_mtime_ns)
+        self.assertEqual(backup_stat.st_mode, source_stat.st_mode)
+
+    def test_backup_without_mocks_keeps_content(self):
+        result = organizer.move_file(
+            self.source, self.destination, backup_path=self.backup_path
+        )
+
+        backup_file = self.backup_path / "song.mp3"
+        self.assertTrue(result["backed_up"])
+        self.assertFalse(self.source.exists())
+        self.assertEqual(backup_file.read_bytes(), self.destination.read_bytes())
+
+
+
+class MoveFileConcurrencyTest(unittest.TestCase):
+    """여러 워커가 동시에 move_file을 호출하는 경우 테스트"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.sources = []
+        for i in range(2):
+            source = self.root / f"in{i}" / "song.mp3"
+            source.parent.mkdir()
+            source.write_bytes(bytes([i]) * 1024)
+            self.sources.append(source)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _move_all(self, destinations, backup_paths=None):
+        results = [None] * len(self.sources)
+
+        def worker(index):
+            results[index] = organizer.move_file(
+                self.sources[index],
+                destinations[index],
+                backup_path=backup_paths[index] if backup_paths else None,
+            )
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(self.sources))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        return results
+
+    def test_backups_copy_concurrently(self):
+        # 두 백업 복사가 동시에 진행 중이어야만 barrier를 통과함 (lock 밖에서 복사)
+        barrier = threading.Barrier(2, timeout=5)
+
+        def copy_for_backup(source, destination):
+            barrier.wait()
+            organizer._fast_copy(source, destination)
+
+        destinations = [self.root / "out" / f"{i}.mp3" for i in range(2)]
+        backup_paths = [self.root / f".backup{i}" for i in range(2)]
+        with mock.patch.object(organizer, "_copy_for_backup", side_effect=copy_for_backup):
+            results = self._move_all(destinations, backup_paths)
+
+        self.assertFalse(barrier.broken)
+        self.assertTrue(all(result["moved"] and result["backed_up"] for result in results))
+
+    def test_same_destination_gets_distinct_names(self):
+        destination = self.root / "out" / "song.mp3"
+        results = self._move_all([destination, destination])
+
+        moved_to = {result["destination"] for result in results}
+        self.assertEqual(moved_to, {str(destination), str(self.root / "out" / "song (1).mp3")})
+        contents = {Path(path).read_bytes() for path in moved_to}
+        self.assertEqual(contents, {b"\x00" * 1024, b"\x01" * 1024})
+
+    def test_failed_move_releases_reserved_name(self):
+        destination = self.root / "out" / "song.mp3"
+        with mock.patch.object(organizer, "_rename_or_copy", side_effect=OSError("boom")):
+            with self.assertRaises(OSError):
+                organizer.move_file(self.sources[0], destination)
+
+        self.assertFalse(destination.exists())
+        self.assertTrue(self.sources[0].exists())
+
+class FastCopyTest(unittest.TestCase):
+    """_fast_copy 테스트"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.source = self.root / "song.mp3"
+        self.source.write_bytes(os.urandom(3 * 1024 * 1024 + 17))
+        os.utime(self.source, ns=(1_000_000_000_000_000_000, 1_100_000_000_000_000_000))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _assert_copied(self, destination: Path):
+        self.assertEqual(destination.read_bytes(), self.source.read_bytes())
+        self.assertEqual(destination.stat().st_mtime_ns, self.source.stat().st_mtime_ns)
+
+    def test_copies_content_and_metadata(self):
+        destination = self.root / "copy.mp3"
+        organizer._fast_copy(self.source, destination)
+        self._assert_copied(destination)
+
+    def test_falls_back_to_buffered_copy(self):
+        destination = self.root / "copy.mp3"
+        destination.write_bytes(b"stale data that must be truncated" * 100_000)
+        with mock.patch.object(os, "copy_file_range", side_effect=OSError, create=True):
+            organizer._fast_copy(self.source, destination)
+        self._assert_copied(destination)
+
+    @unittest.skipUnless(hasattr(os, "copy_file_range"), "copy_file_range 없음")
+    def test_short_copy_file_range_falls_back(self):
+        real_copy_file_range = os.copy_file_range
+        calls = []
+
+        def short_copy(src, dst, count):
+            # 처음 한 번만 조금 복사하고, 이후에는 EOF처럼 0 반환
+            calls.append(count)
+            return real_copy_file_range(src, dst, 4096) if len(calls) == 1 else 0
+
+        destination = self.root / "copy.mp3"
+        with mock.patch.object(os, "copy_file_range", side_effect=short_copy):
+            organizer._fast_copy(self.source, destination)
+        self._assert_copied(destination)
+
+
+class RenameOrCopyTest(unittest.TestCase):
+    """_rename_or_copy 다른 장치 간 이동 테스트"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.source = self.root / "song.mp3"
+        self.source.write_bytes(os.urandom(64 * 1024))
+        self.destination = self.root / "moved.mp3"
+        patcher = mock.patch.object(
+            organizer.os, "replace", side_effect=OSError(errno.EXDEV, "cross-device")
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_cross_device_copies_then_removes_source(self):
+        data = self.source.read_bytes()
+        organizer._rename_or_copy(self.source, self.destination)
+        self.assertFalse(self.source.exists())
+        self.assertEqual(self.destination.read_bytes(), data)
+
+    def test_keeps_source_when_copy_is_truncated(self):
+        def truncated_copy(source, destination):
+            destination.write_bytes(source.read_bytes()[:1000])
+
+        with mock.patch.object(organizer, "_fast_copy", side_effect=truncated_copy):
+            with self.assertRaises(OSError):
+                organizer._rename_or_copy(self.source, self.destination)
+        self.assertTrue(self.source.exists())
+        self.assertFalse(self.destination.exists())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,207 @@
+"""tagger 모듈 테스트"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from mutagen.id3 import ID3
+
+from src import tagger
+from src.metadata import TrackMetadata
+
+# 태그 뒤에 붙일 MPEG 프레임 (mutagen이 MP3로 인식할 수 있는 최소 데이터)
+_AUDIO = (b"\xff\xfb\x90\x64" + b"\x00" * 413) * 4
+
+
+def _size_bytes(size: int, version: int) -> bytes:
+    if version == 4:
+        return bytes([(size >> 21) & 0x7F, (size >> 14) & 0x7F, (size >> 7) & 0x7F, size & 0x7F])
+    return size.to_bytes(4, "big")
+
+
+def _synchsafe(size: int) -> bytes:
+    return _size_bytes(size, 4)
+
+
+def _text_frame(frame_id: str, text: str, version: int, encoding: int = 3) -> bytes:
+    codec = {0: "latin-1", 1: "utf-16", 3: "utf-8"}[encoding]
+    body = bytes([encoding]) + text.encode(codec)
+    return frame_id.encode() + _size_bytes(len(body), version) + b"\x00\x00" + body
+
+
+def _raw_frame(frame_id: str, body: bytes, version: int) -> bytes:
+    return frame_id.encode() + _size_bytes(len(body), version) + b"\x00\x00" + body
+
+
+def _id3_tag(
+    frames: list[bytes],
+    version: int = 4,
+    extended_header: bool = False,
+    padding: int = 0,
+    flags: int = 0,
+) -> bytes:
+    body = b""
+    if extended_header:
+        flags |= 0x40
+        if version == 4:
+            # 크기(자기 자신 포함) + 플래그 바이트 수 + 플래그
+            body += _synchsafe(6) + b"\x01\x00"
+        else:
+            # 크기(자기 자신 제외) + 플래그 + 패딩 크기
+            body += (6).to_bytes(4, "big") + b"\x00\x00" + padding.to_bytes(4, "big")
+    body += b"".join(frames) + b"\x00" * padding
+    return b"ID3" + bytes([version, 0, flags]) + _synchsafe(len(body)) + body
+
+
+def _required_frames(version: int, **overrides) -> list[bytes]:
+    values = {"TIT2": "제목", "TPE1": "Artist", "TALB": "Album"}
+    values.update(overrides)
+    return [_text_frame(frame_id, text, version) for frame_id, text in values.items()]
+
+
+class QuickTagPresenceTest(unittest.TestCase):
+    """_quick_tag_presence / has_complete_tags 테스트 (mutagen 결과와 비교)"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, data: bytes) -> Path:
+        path = self.root / f"{len(list(self.root.iterdir()))}.mp3"
+        path.write_bytes(data + _AUDIO)
+        return path
+
+    def _mutagen_complete(self, path: Path) -> bool:
+        return tagger.has_complete_tags_from_tags(tagger._extract_tags_dict(ID3(str(path))))
+
+    def test_v23_and_v24_with_and_without_extended_header(self):
+        for version in (3, 4):
+            for extended_header in (False, True):
+                with self.subTest(version=version, extended_header=extended_header):
+                    path = self._write(
+                        _id3_tag(
+                            _required_frames(version) + [_text_frame("TCON", "Rock", version)],
+                            version=version,
+                            extended_header=extended_header,
+                        )
+                    )
+                    self.assertEqual(
+                        tagger._quick_tag_presence(path), {"TIT2", "TPE1", "TALB", "TCON"}
+                    )
+                    self.assertTrue(tagger.has_complete_tags(path))
+                    self.assertTrue(self._mutagen_complete(path))
+
+    def test_text_encodings(self):
+        for version in (3, 4):
+            for encoding in (0, 1, 3):
+                with self.subTest(version=version, encoding=encoding):
+                    frames = [
+                        _text_frame("TIT2", "Title", version, encoding),
+                        _text_frame("TPE1", "Artist", version, encoding),
+                        _text_frame("TALB", "Album", version, encoding),
+                    ]
+                    path = self._write(_id3_tag(frames, version=version))
+                    self.assertTrue(tagger.has_complete_tags(path))
+                    self.assertTrue(self._mutagen_complete(path))
+
+    def test_padding_after_frames(self):
+        for version in (3, 4):
+            with self.subTest(version=version):
+                path = self._write(
+                    _id3_tag(_required_frames(version), version=version, padding=2048)
+                )
+                self.assertEqual(tagger._quick_tag_presence(path), {"TIT2", "TPE1", "TALB"})
+                self.assertTrue(tagger.has_complete_tags(path))
+
+    def test_empty_frames_are_not_present(self):
+        empty_bodies = {
+            "encoding byte only": b"\x03",
+            "null terminated": b"\x00\x00",
+            "utf-16 BOM only": b"\x01\xff\xfe\x00\x00",
+        }
+        for version in (3, 4):
+            for name, body in empty_bodies.items():
+                with self.subTest(version=version, body=name):
+                    frames = _required_frames(version)[1:] + [_raw_frame("TIT2", body, version)]
+                    path = self._write(_id3_tag(frames, version=version))
+                    self.assertEqual(tagger._quick_tag_presence(path), {"TPE1", "TALB"})
+                    self.assertFalse(tagger.has_complete_tags(path))
+                    self.assertFalse(self._mutagen_complete(path))
+
+    def test_missing_required_frame(self):
+        path = self._write(_id3_tag(_required_frames(4)[:2]))
+        self.assertFalse(tagger.has_complete_tags(path))
+
+    def test_unsynchronised_tag_falls_back_to_mutagen(self):
+        # 전체 unsynchronisation 플래그가 있으면 직접 읽지 않음 (0xFF가 없는 태그라 내용은 같음)
+        path = self._write(_id3_tag(_required_frames(3), version=3, flags=0x80))
+        self.assertIsNone(tagger._quick_tag_presence(path))
+        self.assertTrue(tagger.has_complete_tags(path))
+
+    def test_no_id3v2_header_falls_back_to_mutagen(self):
+        path = self._write(b"")
+        self.assertIsNone(tagger._quick_tag_presence(path))
+        self.assertFalse(tagger.has_complete_tags(path))
+
+        # ID3v1만 있는 파일은 mutagen 폴백이 v1 태그를 읽어 판단
+        v1 = (
+            b"TAG"
+            + b"Title".ljust(30, b"\x00")
+            + b"Artist".ljust(30, b"\x00")
+            + b"Album".ljust(30, b"\x00")
+            + b"2001"
+            + b"\x00" * 30
+            + b"\xff"
+        )
+        path = self.root / "v1.mp3"
+        path.write_bytes(_AUDIO + v1)
+        self.assertIsNone(tagger._quick_tag_presence(path))
+        self.assertTrue(tagger.has_complete_tags(path))
+
+
+class LoadCurrentTagsTest(unittest.TestCase):
+    """load_current_tags 결과를 tags_up_to_date와 update_tags가 함께 쓰는지 테스트"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "song.mp3"
+        self.path.write_bytes(_id3_tag(_required_frames(4, TIT2="Old Title")) + _AUDIO)
+        self.metadata = TrackMetadata(title="New Title", artist="Artist", album="Album", year=2001)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_update_reuses_loaded_file(self):
+        with mock.patch.object(tagger, "MP3", wraps=tagger.MP3) as mp3:
+            current_tags = tagger.load_current_tags(self.path)
+            self.assertFalse(tagger.tags_up_to_date(current_tags, self.metadata))
+            changes = tagger.update_tags(self.path, self.metadata, current_tags=current_tags)
+
+        self.assertEqual(mp3.call_count, 1)
+        self.assertEqual(changes["title"], {"old": "Old Title", "new": "New Title"})
+        self.assertEqual(changes["year"], {"old": None, "new": 2001})
+
+        saved = tagger.read_current_tags(self.path)
+        self.assertEqual(saved["title"], "New Title")
+        self.assertEqual(saved["year"], 2001)
+        self.assertTrue(tagger.tags_up_to_date(tagger.load_current_tags(self.path), self.metadata))
+
+    def test_dict_current_tags_still_supported(self):
+        current_tags = tagger.read_current_tags(self.path)
+        changes = tagger.update_tags(
+            self.path, self.metadata, dry_run=True, current_tags=current_tags
+        )
+        self.assertEqual(set(changes), {"title", "year"})
+
+    def test_unreadable_file(self):
+        self.path.write_bytes(b"not an mp3")
+        with self.assertRaises(tagger.TaggerError):
+            tagger.load_current_tags(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()